@@ -11,7 +11,7 @@ import numpy as np
 import json
 from datetime import datetime, timedelta, date
 from decimal import Decimal
-from scipy.stats import pearsonr, spearmanr
+from scipy.stats import pearsonr, spearmanr, t as t_dist
 from typing import Dict, List, Any, Tuple
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -98,6 +98,87 @@ class CorrelationAnalysisDemo:
             'github_commits': 1000 + 200 * seasonal_pattern + np.random.normal(0, 100, len(dates))
         })
     
+    @staticmethod
+    def _pearson_block(x_block: np.ndarray, y_block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Column-wise Pearson r and two-sided p-values in one vectorized pass"""
+        n = x_block.shape[0]
+        x_centered = x_block - x_block.mean(axis=0)
+        y_centered = y_block - y_block.mean(axis=0)
+        r = (x_centered * y_centered).sum(axis=0) / np.sqrt(
+            (x_centered ** 2).sum(axis=0) * (y_centered ** 2).sum(axis=0))
+        t_stat = r * np.sqrt((n - 2) / (1 - r ** 2))
+        p = 2 * t_dist.sf(np.abs(t_stat), n - 2)
+        return r, p
+
+    def compute_all(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, List[Dict]]]:
+        """Compute cross-domain correlations, temporal correlations, and entity
+        links in one fused pass instead of three traversals of the demo data"""
+        music = self.demo_data['music']
+        movies = self.demo_data['movies']
+        ts_data = self.demo_data['time_series']
+
+        # Cross-domain pairs share n=100 rows; the Spearman pair rides along
+        # as Pearson on ranks
+        cross_x = np.column_stack([
+            self.demo_data['weather']['temperature'],
+            movies['box_office_revenue'].rank(),
+            self.demo_data['pokemon']['popularity_score']
+        ])
+        cross_y = np.column_stack([
+            music['valence'],
+            movies['soundtrack_popularity'].rank(),
+            music['energy']
+        ])
+        cross_r, cross_p = self._pearson_block(cross_x, cross_y)
+
+        cross_specs = [
+            ('weather', 'music', 'temperature', 'valence', 'pearson'),
+            ('entertainment', 'music', 'box_office_revenue', 'soundtrack_popularity', 'spearman'),
+            ('gaming', 'music', 'pokemon_popularity', 'music_energy', 'pearson')
+        ]
+        cross_correlations = [
+            {
+                'domain1': domain1,
+                'domain2': domain2,
+                'variable1': variable1,
+                'variable2': variable2,
+                'correlation_coefficient': float(cross_r[i]),
+                'p_value': float(cross_p[i]),
+                'method': method,
+                'interpretation': self._interpret_correlation(cross_r[i], cross_p[i]),
+                'sample_size': len(cross_x)
+            }
+            for i, (domain1, domain2, variable1, variable2, method) in enumerate(cross_specs)
+        ]
+
+        # Temporal pairs share n=365 rows
+        temporal_x = np.column_stack([ts_data['music_streams'], ts_data['movie_ticket_sales']])
+        temporal_y = np.column_stack([ts_data['avg_temperature'], ts_data['github_commits']])
+        temporal_r, temporal_p = self._pearson_block(temporal_x, temporal_y)
+
+        time_range = f"{ts_data['date'].min()} to {ts_data['date'].max()}"
+        temporal_specs = [
+            ('music', 'weather', 'daily_streams', 'temperature'),
+            ('entertainment', 'development', 'ticket_sales', 'github_commits')
+        ]
+        temporal_correlations = [
+            {
+                'domain1': domain1,
+                'domain2': domain2,
+                'variable1': variable1,
+                'variable2': variable2,
+                'correlation_coefficient': float(temporal_r[i]),
+                'p_value': float(temporal_p[i]),
+                'method': 'pearson_temporal',
+                'interpretation': self._interpret_correlation(temporal_r[i], temporal_p[i]),
+                'sample_size': len(ts_data),
+                'time_range': time_range
+            }
+            for i, (domain1, domain2, variable1, variable2) in enumerate(temporal_specs)
+        ]
+
+        return cross_correlations, temporal_correlations, self.run_entity_linking_demo()
+
     def calculate_cross_domain_correlations(self) -> List[Dict[str, Any]]:
         """Calculate correlations between different data domains"""
         correlations = []
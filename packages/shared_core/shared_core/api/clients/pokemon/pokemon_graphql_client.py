@@ -38,10 +38,29 @@ class PokemonGraphQLClient(BaseAPIClient):
         # Initialize GraphQL client
         transport = HTTPXAsyncTransport(url=self.base_url)
         self.gql_client = Client(transport=transport, fetch_schema_from_transport=True)
+        self._gql_session = None
 
         if self.debug_mode:
             self.logger.info("⚡ Initialized Pokemon GraphQL client")
 
+    async def _session(self):
+        """
+        Connect the GraphQL transport once and reuse it for every query.
+
+        execute_async reconnects (and refetches the schema) per call; a
+        persistent session pays the TCP/TLS handshake and schema fetch once.
+        """
+        if self._gql_session is None:
+            self._gql_session = await self.gql_client.connect_async(reconnecting=True)
+        return self._gql_session
+
+    async def close(self) -> None:
+        """Close the GraphQL transport and the underlying HTTP client"""
+        if self._gql_session is not None:
+            await self.gql_client.close_async()
+            self._gql_session = None
+        await super().close()
+
     async def get_pokemon_for_correlation(
         self,
         limit: int = 100,
@@ -98,7 +117,8 @@ class PokemonGraphQLClient(BaseAPIClient):
         variables = {"limit": limit, "offset": offset}
 
         try:
-            result = await self.gql_client.execute_async(query, variables)
+            session = await self._session()
+            result = await session.execute(query, variables)
 
             return APIResponse(
                 data=result,
@@ -160,7 +180,8 @@ class PokemonGraphQLClient(BaseAPIClient):
         variables = {"typeName": type_name}
 
         try:
-            result = await self.gql_client.execute_async(query, variables)
+            session = await self._session()
+            result = await session.execute(query, variables)
             return APIResponse(
                 data=result, success=True, status_code=200, response_time_ms=0
             )
@@ -213,7 +234,8 @@ class PokemonGraphQLClient(BaseAPIClient):
         variables = {"habitatName": habitat_name}
 
         try:
-            result = await self.gql_client.execute_async(query, variables)
+            session = await self._session()
+            result = await session.execute(query, variables)
             return APIResponse(
                 data=result, success=True, status_code=200, response_time_ms=0
             )
@@ -254,7 +276,8 @@ class PokemonGraphQLClient(BaseAPIClient):
         variables = {"limit": limit}
 
         try:
-            result = await self.gql_client.execute_async(query, variables)
+            session = await self._session()
+            result = await session.execute(query, variables)
             return APIResponse(
                 data=result, success=True, status_code=200, response_time_ms=0
             )
@@ -298,7 +321,8 @@ class PokemonGraphQLClient(BaseAPIClient):
         variables = {"generationName": generation_name, "limit": limit}
 
         try:
-            result = await self.gql_client.execute_async(query, variables)
+            session = await self._session()
+            result = await session.execute(query, variables)
             return APIResponse(
                 data=result,
                 success=True,
@@ -15,6 +15,9 @@ import urllib.parse
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 
+import httpx
+import numpy as np
+
 from ....config.base_client import BaseAPIClient, APIResponse
 from ....utils.centralized_logging import CentralizedLogger
 from ....auth.spotify_oauth import SpotifyOAuth, SpotifyOAuthError
@@ -48,6 +51,12 @@ class SpotifyClient(BaseAPIClient):
             debug_mode=debug_mode,
             rate_limit_per_minute=100,  # Spotify allows 100 requests per minute
             client_name="spotify",
+            # Multiplex the concurrent batch fetches over one HTTP/2
+            # connection and keep it warm between calls
+            http2=kwargs.pop("http2", True),
+            limits=kwargs.pop("limits", None) or httpx.Limits(
+                max_keepalive_connections=20, max_connections=20
+            ),
             **kwargs
         )
         
@@ -482,6 +491,53 @@ class SpotifyClient(BaseAPIClient):
         
         return correlation_features
     
+    # Numeric fields stacked by extract_audio_features_for_correlation_batch
+    CORRELATION_FEATURE_KEYS = (
+        "valence", "energy", "danceability", "acousticness",
+        "instrumentalness", "tempo", "loudness", "speechiness"
+    )
+    
+    def extract_audio_features_for_correlation_batch(
+        self, features_list: List[Optional[Dict[str, Any]]]
+    ) -> List[Optional[Dict[str, float]]]:
+        """
+        Extract correlation features for a whole batch of tracks at once
+        
+        Vectorized counterpart to extract_audio_features_for_correlation:
+        the numeric fields are stacked into one (n_tracks, n_features) float
+        array and missing values are masked in a single NumPy pass instead of
+        rebuilding each record's dict through repeated .get dispatch. None
+        entries (tracks without audio features) stay None in the output.
+        
+        Args:
+            features_list: Audio features from Spotify API (None entries allowed)
+            
+        Returns:
+            List[Optional[Dict[str, float]]]: Correlation features per track
+        """
+        keys = self.CORRELATION_FEATURE_KEYS
+        matrix = np.array(
+            [
+                [np.nan] * len(keys) if features is None
+                else [features.get(key) if features.get(key) is not None else np.nan for key in keys]
+                for features in features_list
+            ],
+            dtype=np.float64
+        ).reshape(len(features_list), len(keys))
+        present = ~np.isnan(matrix)
+        
+        extracted: List[Optional[Dict[str, float]]] = []
+        for features, row, mask in zip(features_list, matrix, present):
+            if features is None:
+                extracted.append(None)
+            else:
+                extracted.append({key: float(value) for key, value, keep in zip(keys, row, mask) if keep})
+        
+        if self.debug_mode:
+            self.logger.debug(f"📊 Extracted correlation features for {len(extracted)} tracks")
+        
+        return extracted
+    
     # Modern OAuth methods using SpotifyOAuth class
     async def get_oauth_client(self) -> SpotifyOAuth:
         """
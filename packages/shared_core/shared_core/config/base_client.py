@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin
 
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 from pydantic import BaseModel, Field
 
@@ -61,7 +62,9 @@ class BaseAPIClient:
         max_retries: int = 3,
         timeout: int = 30,
         cache_ttl: int = 300,  # 5 minutes
-        client_name: str = "base_client"
+        client_name: str = "base_client",
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None
     ):
         """
         Initialize the enhanced API client
@@ -76,6 +79,8 @@ class BaseAPIClient:
             timeout: Request timeout in seconds
             cache_ttl: Cache time-to-live in seconds
             client_name: Client name for logging
+            http2: Negotiate HTTP/2 so concurrent requests multiplex one connection
+            limits: Connection pool limits (httpx defaults when None)
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -98,10 +103,16 @@ class BaseAPIClient:
         # Response cache
         self.response_cache: Dict[str, Dict[str, Any]] = {}
         
-        # HTTP client
+        # HTTP client; only pass limits when the caller provided one so the
+        # default stays httpx's DEFAULT_LIMITS rather than an unlimited pool
+        client_kwargs = {}
+        if limits is not None:
+            client_kwargs["limits"] = limits
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
-            headers=self._get_default_headers()
+            headers=self._get_default_headers(),
+            http2=http2,
+            **client_kwargs
         )
         
         if self.debug_mode:
@@ -294,8 +305,10 @@ class BaseAPIClient:
             errors = []
             
             try:
-                response_data = response.json()
-            except json.JSONDecodeError:
+                # orjson parses the raw bytes directly - no intermediate str
+                # decode, and roughly twice the throughput on large payloads
+                response_data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 if response.text:
                     response_data = {"raw_response": response.text}
             
@@ -97,7 +97,23 @@ class SpotifyConfig:
             Optional[str]: Refresh token if available
         """
         return os.getenv("SPOTIFY_REFRESH_TOKEN")
-    
+
+    @staticmethod
+    def token_expires_at() -> Optional[float]:
+        """
+        Get stored access token expiry (if available)
+
+        Returns:
+            Optional[float]: Unix timestamp the access token expires at
+        """
+        raw = os.getenv("SPOTIFY_TOKEN_EXPIRES_AT")
+        if not raw:
+            return None
+        try:
+            return float(raw)
+        except ValueError:
+            return None
+
     # OAuth endpoint constants
     OAUTH_AUTHORIZE_URL = "https://accounts.spotify.com/authorize"
     OAUTH_TOKEN_URL = "https://accounts.spotify.com/api/token"
@@ -12,6 +12,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -37,6 +38,9 @@ class ModelInfo(BaseModel):
 class SwitchModelRequest(BaseModel):
     modelName: str
 
+# Set SIMULATE_LATENCY=1 to restore the 500ms artificial chat delay
+SIMULATE_LATENCY = bool(os.getenv("SIMULATE_LATENCY"))
+
 # Global state
 current_model = "microsoft/DialoGPT-medium"
 available_models = [
@@ -58,28 +62,45 @@ available_models = [
     )
 ]
 
+# Static views over available_models, computed once at import
+_MODEL_NAMES = frozenset(model.name for model in available_models)
+_MODELS_JSON = [model.dict() for model in available_models]
+
+# Mock response templates, built once so each chat call formats a single string
+_RESPONSE_TEMPLATES = {
+    "microsoft/DialoGPT-medium": "DialoGPT: I understand you said '%s'. How can I help you further?",
+    "gpt2": "GPT-2: Based on your message about '%s', here's my generated response...",
+    "distilbert-base-uncased": "DistilBERT: I've analyzed your text '%s' and here's my understanding...",
+    "openai-gpt": "OpenAI GPT: Thank you for your message '%s'. Let me provide a helpful response..."
+}
+
 # Mock LLM responses (you can replace this with actual model integration)
 def generate_mock_response(message: str, model_name: str) -> str:
     """
     Generate a mock response based on the input message and model.
     Replace this with actual LLM integration (OpenAI, Hugging Face, etc.)
     """
-    responses = {
-        "microsoft/DialoGPT-medium": f"DialoGPT: I understand you said '{message}'. How can I help you further?",
-        "gpt2": f"GPT-2: Based on your message about '{message}', here's my generated response...",
-        "distilbert-base-uncased": f"DistilBERT: I've analyzed your text '{message}' and here's my understanding...",
-        "openai-gpt": f"OpenAI GPT: Thank you for your message '{message}'. Let me provide a helpful response..."
-    }
-    
-    return responses.get(model_name, f"Model {model_name}: Thank you for your message. I'm processing: {message}")
+    template = _RESPONSE_TEMPLATES.get(model_name)
+    if template is None:
+        return f"Model {model_name}: Thank you for your message. I'm processing: {message}"
+    return template % (message,)
+
+async def _now_refresher(app: FastAPI):
+    """Refresh the shared ISO timestamp every 100ms instead of per request"""
+    while True:
+        app.state.now_iso = datetime.now().isoformat()
+        await asyncio.sleep(0.1)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
     logger.info("🚀 LLM Chat Backend starting up...")
-    logger.info(f"📋 Available models: {[model.name for model in available_models]}")
-    logger.info(f"🤖 Current model: {current_model}")
+    logger.info("📋 Available models: %s", [model.name for model in available_models])
+    logger.info("🤖 Current model: %s", current_model)
+    app.state.now_iso = datetime.now().isoformat()
+    refresher = asyncio.create_task(_now_refresher(app))
     yield
+    refresher.cancel()
     logger.info("📴 LLM Chat Backend shutting down...")
 
 # Initialize FastAPI app
@@ -87,7 +108,8 @@ app = FastAPI(
     title="LLM Chat Backend",
     description="Backend API for LLM Chat Interface",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -104,7 +126,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": app.state.now_iso,
         "current_model": current_model
     }
 
@@ -112,37 +134,39 @@ async def health_check():
 async def get_available_models():
     """Get list of available models"""
     return {
-        "available_models": [model.dict() for model in available_models],
+        "available_models": _MODELS_JSON,
         "current_model": current_model
     }
 
-@app.post("/api/chat", response_model=ChatResponse)
+@app.post("/api/chat", response_model=ChatResponse, response_model_exclude_unset=True)
 async def chat(request: ChatRequest):
     """Handle chat messages"""
     try:
         # Use the specified model or fall back to current model
         model_to_use = request.model or current_model
         
-        logger.info(f"💬 Processing chat message with model: {model_to_use}")
-        logger.info(f"📝 Message: {request.message[:100]}...")  # Log first 100 chars
+        logger.info("💬 Processing chat message with model: %s", model_to_use)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📝 Message: %s...", request.message[:100])  # Log first 100 chars
         
-        # Simulate processing time (remove in production)
-        await asyncio.sleep(0.5)
+        # Optional simulated processing time for demos (off by default)
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(0.5)
         
         # Generate response (replace with actual LLM integration)
         response_text = generate_mock_response(request.message, model_to_use)
         
         response = ChatResponse(
             response=response_text,
-            timestamp=datetime.now().isoformat(),
+            timestamp=app.state.now_iso,
             model=model_to_use
         )
         
-        logger.info(f"✅ Generated response successfully")
+        logger.info("✅ Generated response successfully")
         return response
         
     except Exception as e:
-        logger.error(f"❌ Error processing chat: {str(e)}")
+        logger.error("❌ Error processing chat: %s", e)
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
 
 @app.post("/api/switch-model")
@@ -151,49 +175,54 @@ async def switch_model(request: SwitchModelRequest):
     global current_model
     
     # Validate that the model exists
-    model_names = [model.name for model in available_models]
-    if request.modelName not in model_names:
+    if request.modelName not in _MODEL_NAMES:
         raise HTTPException(
             status_code=400, 
-            detail=f"Model '{request.modelName}' not found. Available models: {model_names}"
+            detail=f"Model '{request.modelName}' not found. Available models: {sorted(_MODEL_NAMES)}"
         )
     
     old_model = current_model
     current_model = request.modelName
     
-    logger.info(f"🔄 Model switched from '{old_model}' to '{current_model}'")
+    logger.info("🔄 Model switched from '%s' to '%s'", old_model, current_model)
     
     return {
         "success": True,
         "previous_model": old_model,
         "current_model": current_model,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": app.state.now_iso
     }
 
+# Fully static, so serialize it exactly once at import
+_ROOT_RESPONSE = ORJSONResponse({
+    "message": "LLM Chat Backend API",
+    "version": "1.0.0",
+    "docs_url": "/docs",
+    "health_check": "/health",
+    "models_endpoint": "/api/models",
+    "chat_endpoint": "/api/chat",
+    "switch_model_endpoint": "/api/switch-model"
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "LLM Chat Backend API",
-        "version": "1.0.0",
-        "docs_url": "/docs",
-        "health_check": "/health",
-        "models_endpoint": "/api/models",
-        "chat_endpoint": "/api/chat",
-        "switch_model_endpoint": "/api/switch-model"
-    }
+    return _ROOT_RESPONSE
 
 if __name__ == "__main__":
     # Run the server
     port = int(os.getenv("PORT", 3001))
     host = os.getenv("HOST", "0.0.0.0")
     
-    logger.info(f"🌐 Starting server on {host}:{port}")
+    logger.info("🌐 Starting server on %s:%s", host, port)
     
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
         reload=False,  # Disable auto-reload to prevent shutdown issues
+        loop="auto",  # uvloop when importable (uvicorn[standard]), asyncio otherwise
+        http="httptools",  # C HTTP parser instead of pure-Python h11
+        access_log=False,  # Skip per-request access-log formatting
         log_level="info"
     )
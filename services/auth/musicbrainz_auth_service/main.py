@@ -28,19 +28,21 @@ Usage:
 """
 
 import asyncio
-import json
 import os
+import secrets
+import time
 import sys
-import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+import orjson
 import redis.asyncio as redis
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from pydantic import BaseModel, ConfigDict
 
 # Add the shared_core package to the path
 current_dir = Path(__file__).parent
@@ -54,13 +56,73 @@ from shared_core.logging.centralized_logger import CentralizedLogger
 # Initialize logger
 logger = CentralizedLogger.get_logger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and release them on shutdown."""
+    global oauth_client, redis_client
+    
+    logger.info("Starting MusicBrainz OAuth service...")
+    
+    try:
+        # Initialize OAuth client
+        oauth_client = MusicBrainzOAuth()
+        logger.info("OAuth client initialized successfully")
+        
+        # Initialize Redis client for session storage. An explicitly sized
+        # blocking pool keeps concurrent logins/callbacks from serializing on
+        # one connection; tune REDIS_POOL_SIZE to worker count x expected
+        # concurrent sessions.
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=int(os.getenv("REDIS_POOL_SIZE", "50")),
+            timeout=5,
+            decode_responses=True
+        )
+        redis_client = redis.Redis(connection_pool=pool)
+        
+        # Test Redis connection; the timeout keeps a degraded pool from
+        # silently hanging a worker at startup
+        await asyncio.wait_for(redis_client.ping(), timeout=5)
+        logger.info("Redis connection established successfully")
+        
+        # Listen for cross-worker logout notifications
+        invalidation_listener = asyncio.create_task(_listen_for_invalidations())
+        
+        # Log configuration
+        oauth_config = MusicBrainzConfig.get_oauth_config()
+        logger.info(f"OAuth configuration: {oauth_config}")
+        
+    except Exception as e:
+        logger.error(f"Failed to initialize services: {e}")
+        raise
+    
+    yield
+    
+    logger.info("Shutting down MusicBrainz OAuth service...")
+    
+    invalidation_listener.cancel()
+    try:
+        await invalidation_listener
+    except asyncio.CancelledError:
+        pass
+    
+    if oauth_client:
+        await oauth_client.close()
+    
+    if redis_client:
+        await redis_client.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="MusicBrainz OAuth Service",
     description="OAuth 2.0 authentication service for MusicBrainz API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS configuration for local development
@@ -72,6 +134,88 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# In-process L1 cache in front of Redis for hot session polls. Entries live
+# for a short TTL; token expiry itself is still enforced by the stored
+# expires_at, so a brief staleness window is safe.
+_TOKEN_CACHE_TTL = 30  # seconds
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: Dict[str, Any] = {}
+
+# Pub/sub channel used to evict logged-out sessions from every worker's L1
+# cache - without it, other workers would keep serving a revoked token for
+# up to _TOKEN_CACHE_TTL after logout
+_INVALIDATE_CHANNEL = "auth:invalidate"
+
+
+async def _listen_for_invalidations() -> None:
+    """Evict sessions from the L1 cache when any worker logs them out."""
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(_INVALIDATE_CHANNEL)
+    try:
+        async for message in pubsub.listen():
+            if message.get("type") == "message":
+                _token_cache.pop(message["data"], None)
+    finally:
+        await pubsub.unsubscribe(_INVALIDATE_CHANNEL)
+        await pubsub.aclose()
+
+
+def _token_cache_get(session_id: str) -> Optional[Dict[str, Any]]:
+    """Return cached token data for a session, or None on miss/staleness."""
+    entry = _token_cache.get(session_id)
+    if entry is None:
+        return None
+    cached_at, token_data = entry
+    if time.monotonic() - cached_at > _TOKEN_CACHE_TTL:
+        _token_cache.pop(session_id, None)
+        return None
+    return token_data
+
+
+def _token_cache_put(session_id: str, token_data: Dict[str, Any]) -> None:
+    """Cache parsed token data, evicting the oldest entry when full."""
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[session_id] = (time.monotonic(), token_data)
+
+
+# In-flight Redis fetches keyed by session, so concurrent polls for the same
+# session share one round trip instead of issuing duplicates
+_inflight_loads: Dict[str, "asyncio.Task"] = {}
+
+
+async def _fetch_token(session_id: str) -> Optional[Dict[str, Any]]:
+    """Read the token hash fields from Redis and populate the L1 cache."""
+    access_token, token_type, expires_at_ts, scope = await redis_client.hmget(
+        f"token:{session_id}", "access_token", "token_type", "expires_at_ts", "scope")
+    
+    if not access_token:
+        return None
+    
+    token_data = {
+        "access_token": access_token,
+        "token_type": token_type or "Bearer",
+        "expires_at_ts": int(expires_at_ts),
+        "scope": scope or ""
+    }
+    _token_cache_put(session_id, token_data)
+    return token_data
+
+
+async def _load_token(session_id: str) -> Optional[Dict[str, Any]]:
+    """Shared token loader: L1 cache, then a coalesced Redis fetch."""
+    token_data = _token_cache_get(session_id)
+    if token_data is not None:
+        return token_data
+    
+    task = _inflight_loads.get(session_id)
+    if task is None:
+        task = asyncio.create_task(_fetch_token(session_id))
+        _inflight_loads[session_id] = task
+        task.add_done_callback(lambda _: _inflight_loads.pop(session_id, None))
+    return await task
+
+
 # Global variables
 oauth_client: Optional[MusicBrainzOAuth] = None
 redis_client: Optional[redis.Redis] = None
@@ -90,6 +234,10 @@ class AuthStatusResponse(BaseModel):
 
 
 class TokenResponse(BaseModel):
+    # Frozen models skip __setattr__ machinery and let pydantic-core reuse
+    # its fast validation path on the hot callback/refresh endpoints
+    model_config = ConfigDict(frozen=True)
+    
     access_token: str
     refresh_token: Optional[str] = None
     expires_in: int
@@ -97,57 +245,39 @@ class TokenResponse(BaseModel):
     scope: str = ""
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup."""
-    global oauth_client, redis_client
-    
-    logger.info("Starting MusicBrainz OAuth service...")
-    
-    try:
-        # Initialize OAuth client
-        oauth_client = MusicBrainzOAuth()
-        logger.info("OAuth client initialized successfully")
-        
-        # Initialize Redis client for session storage
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        redis_client = redis.from_url(redis_url)
-        
-        # Test Redis connection
-        await redis_client.ping()
-        logger.info("Redis connection established successfully")
-        
-        # Log configuration
-        oauth_config = MusicBrainzConfig.get_oauth_config()
-        logger.info(f"OAuth configuration: {oauth_config}")
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize services: {e}")
-        raise
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on shutdown."""
-    global oauth_client, redis_client
-    
-    logger.info("Shutting down MusicBrainz OAuth service...")
-    
-    if oauth_client:
-        await oauth_client.close()
-    
-    if redis_client:
-        await redis_client.close()
+# Health body cached with one-second granularity: load balancers probe this
+# endpoint constantly and the payload only changes when the clock second does
+_health_cache = (0, b"")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "service": "musicbrainz-oauth"
-    }
+    global _health_cache
+    now = int(time.time())
+    if _health_cache[0] != now:
+        body = orjson.dumps({
+            "status": "healthy",
+            "timestamp": datetime.utcfromtimestamp(now).isoformat() + "Z",
+            "service": "musicbrainz-oauth"
+        })
+        _health_cache = (now, body)
+    return Response(content=_health_cache[1], media_type="application/json")
+
+
+# Strong references to fire-and-forget writes (the loop only keeps weak ones)
+_background_writes: set = set()
+
+
+def _log_state_write_result(task: asyncio.Task) -> None:
+    """Surface failures from the fire-and-forget OAuth state write"""
+    _background_writes.discard(task)
+    try:
+        if not task.result():
+            # nx=True returns a falsy result when the state key already existed
+            logger.error("OAuth state write skipped: state key already existed")
+    except Exception as e:
+        logger.error(f"OAuth state write failed: {e}")
 
 
 @app.get("/auth/musicbrainz/login")
@@ -158,24 +288,29 @@ async def login():
     Generates authorization URL and redirects user to MusicBrainz for authentication.
     """
     try:
-        # Generate session ID for this OAuth flow
-        session_id = str(uuid.uuid4())
+        # Generate session ID for this OAuth flow; token_urlsafe gives a
+        # crypto-random string in one call with a ~40% shorter Redis key
+        session_id = secrets.token_urlsafe(16)
         
         # Generate authorization URL with state parameter
         auth_url, state = oauth_client.get_authorization_url()
         
-        # Store state in Redis with expiration (10 minutes)
-        session_data = {
-            "state": state,
-            "created_at": datetime.utcnow().isoformat() + "Z",
-            "session_id": session_id
-        }
-        
-        await redis_client.setex(
+        # Store state in Redis with expiration (10 minutes). The state is
+        # already the key and the value only ever needs to recover the
+        # session_id, so a native Redis string skips serialization entirely
+        # in both directions.
+        # Fire-and-forget: the browser needs at least one round trip to reach
+        # MusicBrainz before the callback can fire, so the state write can
+        # complete in parallel with the redirect. The task is kept strongly
+        # referenced and its done-callback logs NX conflicts and Redis errors.
+        task = asyncio.ensure_future(redis_client.set(
             f"oauth_state:{state}",
-            600,  # 10 minutes
-            json.dumps(session_data)
-        )
+            session_id,
+            ex=600,  # 10 minutes
+            nx=True  # never silently overwrite an existing state
+        ))
+        _background_writes.add(task)
+        task.add_done_callback(_log_state_write_result)
         
         logger.info(f"OAuth flow initiated for session: {session_id}")
         logger.debug(f"Generated state parameter: {state}")
@@ -205,7 +340,7 @@ async def callback(code: Optional[str] = None, state: Optional[str] = None, erro
         # Check for authorization errors
         if error:
             logger.error(f"OAuth authorization error: {error}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "authorization_failed", "description": error}
             )
@@ -218,62 +353,63 @@ async def callback(code: Optional[str] = None, state: Optional[str] = None, erro
                 detail="Missing authorization code or state parameter"
             )
         
-        # Retrieve and validate state from Redis
-        session_data_json = await redis_client.get(f"oauth_state:{state}")
-        if not session_data_json:
+        # Atomically fetch and consume the state in one round trip; GETDEL
+        # also closes the replay window between a GET and a later DELETE
+        session_id = await redis_client.getdel(f"oauth_state:{state}")
+        if not session_id:
             logger.error("Invalid or expired state parameter")
             raise HTTPException(
                 status_code=400,
                 detail="Invalid or expired state parameter"
             )
         
-        session_data = json.loads(session_data_json)
-        expected_state = session_data["state"]
-        session_id = session_data["session_id"]
-        
         logger.info(f"Processing OAuth callback for session: {session_id}")
         
         # Exchange authorization code for access token
         token_info = await oauth_client.exchange_code_for_token(
             authorization_code=code,
             state=state,
-            expected_state=expected_state
+            expected_state=state
         )
         
-        # Store token information in Redis (expires when token expires)
-        token_data = {
-            **token_info,
+        # Store token information in Redis as a HASH (expires when the token
+        # expires) so status polls can read single fields without a JSON parse
+        token_fields = {
+            "access_token": token_info["access_token"],
+            "refresh_token": token_info.get("refresh_token") or "",
+            "token_type": token_info["token_type"],
+            "scope": token_info["scope"],
             "session_id": session_id,
-            "expires_at": token_info["expires_at"].isoformat() + "Z"
+            # Epoch seconds: expiry checks become an integer compare instead
+            # of ISO parsing and tz gymnastics
+            "expires_at_ts": int(token_info["expires_at"].timestamp())
         }
         
-        # Store token with session ID as key
-        await redis_client.setex(
-            f"token:{session_id}",
-            token_info["expires_in"],
-            json.dumps(token_data, default=str)
-        )
-        
-        # Clean up state data
-        await redis_client.delete(f"oauth_state:{state}")
+        # Store token with session ID as key in one atomic round trip
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(f"token:{session_id}", mapping=token_fields)
+            pipe.expire(f"token:{session_id}", token_info["expires_in"])
+            # Wake any pub-sub waiters (e.g. the OAuth flow tester) the
+            # instant the flow completes instead of leaving them polling
+            pipe.publish("oauth:callback", session_id)
+            await pipe.execute()
         
         logger.info(f"OAuth flow completed successfully for session: {session_id}")
         
-        # Return token information
-        return JSONResponse(
-            content={
-                "message": "Authentication successful",
-                "session_id": session_id,
-                "token": TokenResponse(
-                    access_token=token_info["access_token"],
-                    refresh_token=token_info.get("refresh_token"),
-                    expires_in=token_info["expires_in"],
-                    token_type=token_info["token_type"],
-                    scope=token_info["scope"]
-                ).dict(),
-                "expires_at": token_info["expires_at"].isoformat() + "Z"
-            }
-        )
+        # Return token information; the default ORJSONResponse serializes the
+        # nested model once instead of dict() plus a stdlib json re-encode
+        return {
+            "message": "Authentication successful",
+            "session_id": session_id,
+            "token": TokenResponse(
+                access_token=token_info["access_token"],
+                refresh_token=token_info.get("refresh_token"),
+                expires_in=token_info["expires_in"],
+                token_type=token_info["token_type"],
+                scope=token_info["scope"]
+            ),
+            "expires_at": token_info["expires_at"].isoformat() + "Z"
+        }
         
     except MusicBrainzOAuthError as e:
         logger.error(f"OAuth error during callback: {e}")
@@ -297,12 +433,17 @@ async def refresh_token(request: TokenRefreshRequest):
         
         logger.info("Token refreshed successfully")
         
-        return TokenResponse(
-            access_token=new_token_info["access_token"],
-            refresh_token=new_token_info.get("refresh_token"),
-            expires_in=new_token_info["expires_in"],
-            token_type=new_token_info["token_type"],
-            scope=new_token_info["scope"]
+        # model_dump_json() serializes in pydantic-core's Rust layer; handing
+        # the bytes straight to Response skips FastAPI's jsonable_encoder pass
+        return Response(
+            content=TokenResponse(
+                access_token=new_token_info["access_token"],
+                refresh_token=new_token_info.get("refresh_token"),
+                expires_in=new_token_info["expires_in"],
+                token_type=new_token_info["token_type"],
+                scope=new_token_info["scope"]
+            ).model_dump_json(),
+            media_type="application/json"
         )
         
     except MusicBrainzOAuthError as e:
@@ -322,26 +463,19 @@ async def get_auth_status(session_id: str) -> AuthStatusResponse:
         session_id: Session ID from OAuth flow
     """
     try:
-        # Retrieve token data from Redis
-        token_data_json = await redis_client.get(f"token:{session_id}")
+        token_data = await _load_token(session_id)
         
-        if not token_data_json:
+        if token_data is None:
             return AuthStatusResponse(authenticated=False)
         
-        token_data = json.loads(token_data_json)
-        
-        # Parse expiration time
-        expires_at = datetime.fromisoformat(token_data["expires_at"].replace("Z", "+00:00"))
-        
-        # Check if token is still valid
-        if datetime.utcnow() > expires_at.replace(tzinfo=None):
-            # Token expired, remove from storage
-            await redis_client.delete(f"token:{session_id}")
+        # Check if token is still valid; the key expiry is enforced by Redis
+        # itself - no explicit DELETE round trip needed
+        if time.time() > token_data["expires_at_ts"]:
             return AuthStatusResponse(authenticated=False)
         
         return AuthStatusResponse(
             authenticated=True,
-            expires_at=expires_at.replace(tzinfo=None),
+            expires_at=datetime.utcfromtimestamp(token_data["expires_at_ts"]),
             scopes=token_data.get("scope", ""),
             user_id=session_id
         )
@@ -360,27 +494,20 @@ async def get_token(session_id: str):
         session_id: Session ID from OAuth flow
     """
     try:
-        # Retrieve token data from Redis
-        token_data_json = await redis_client.get(f"token:{session_id}")
+        token_data = await _load_token(session_id)
         
-        if not token_data_json:
+        if token_data is None:
             raise HTTPException(status_code=404, detail="Token not found or expired")
         
-        token_data = json.loads(token_data_json)
-        
-        # Parse expiration time
-        expires_at = datetime.fromisoformat(token_data["expires_at"].replace("Z", "+00:00"))
-        
-        # Check if token is still valid
-        if datetime.utcnow() > expires_at.replace(tzinfo=None):
-            # Token expired, remove from storage
-            await redis_client.delete(f"token:{session_id}")
+        # Check if token is still valid; expiry eviction is handled by the
+        # key TTL on the Redis side
+        if time.time() > token_data["expires_at_ts"]:
             raise HTTPException(status_code=401, detail="Token expired")
         
         return {
             "access_token": token_data["access_token"],
             "token_type": token_data.get("token_type", "Bearer"),
-            "expires_at": token_data["expires_at"],
+            "expires_at": datetime.utcfromtimestamp(token_data["expires_at_ts"]).isoformat() + "Z",
             "scope": token_data.get("scope", "")
         }
         
@@ -391,6 +518,47 @@ async def get_token(session_id: str):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/auth/musicbrainz/status_and_token/{session_id}")
+async def get_status_and_token(session_id: str):
+    """
+    Fetch authentication status and token in one round trip.
+    
+    Saves SPA pollers that need both from paying two Redis GETs on the
+    same key.
+    
+    Args:
+        session_id: Session ID from OAuth flow
+    """
+    try:
+        token_data = await _load_token(session_id)
+        
+        if token_data is None:
+            return {"status": AuthStatusResponse(authenticated=False), "token": None}
+        
+        if time.time() > token_data["expires_at_ts"]:
+            return {"status": AuthStatusResponse(authenticated=False), "token": None}
+        
+        expires_at = datetime.utcfromtimestamp(token_data["expires_at_ts"])
+        return {
+            "status": AuthStatusResponse(
+                authenticated=True,
+                expires_at=expires_at,
+                scopes=token_data.get("scope", ""),
+                user_id=session_id
+            ),
+            "token": {
+                "access_token": token_data["access_token"],
+                "token_type": token_data.get("token_type", "Bearer"),
+                "expires_at": expires_at.isoformat() + "Z",
+                "scope": token_data.get("scope", "")
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"Error fetching status and token: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.delete("/auth/musicbrainz/logout/{session_id}")
 async def logout(session_id: str):
     """
@@ -400,8 +568,15 @@ async def logout(session_id: str):
         session_id: Session ID to logout
     """
     try:
-        # Remove token from Redis
-        result = await redis_client.delete(f"token:{session_id}")
+        # Remove token from the L1 cache and Redis. UNLINK reclaims memory
+        # on a background thread, so mass-logout sweeps can't stall Redis.
+        # The publish tells every other worker to evict the session from its
+        # own L1 cache too, closing the cross-worker staleness window.
+        _token_cache.pop(session_id, None)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.unlink(f"token:{session_id}")
+        pipe.publish(_INVALIDATE_CHANNEL, session_id)
+        result, _ = await pipe.execute()
         
         if result:
             logger.info(f"Successfully logged out session: {session_id}")
@@ -434,11 +609,28 @@ if __name__ == "__main__":
     except ImportError:
         pass
     
-    # Start the server
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+    # Start the server on the C-accelerated loop and HTTP parser when
+    # available: loop="auto" picks uvloop wherever uvicorn[standard] installs
+    # it, without hard-failing on Windows where uvloop doesn't exist. The
+    # reload file-watcher forces single-process mode, so keep it behind
+    # ENV=dev and scale across cores otherwise.
+    if os.getenv("ENV") == "dev":
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            loop="auto",
+            http="httptools",
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+            loop="auto",
+            http="httptools",
+            log_level="info"
+        )
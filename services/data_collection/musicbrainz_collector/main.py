@@ -21,13 +21,19 @@ Environment Variables:
 """
 
 import asyncio
-import json
+import hashlib
 import os
+import time
+import uuid
 import sys
 from datetime import datetime
+from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Dict, List, Any
 
+import orjson
+import redis.asyncio as redis
+
 # Add the shared_core package to the path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages" / "shared_core"))
 
@@ -36,6 +42,21 @@ from shared_core.api.clients.musicbrainz import MusicBrainzClient
 from shared_core.logging.centralized_logger import CentralizedLogger
 
 
+# Rolling-window rate limiter shared across collector processes. Local
+# asyncio.sleep gating can't coordinate workers, so each would consume the
+# 1 req/s budget independently; this Lua script makes the check-and-claim
+# atomic in one Redis round trip.
+_RATE_SLOT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], 2)
+    return 1
+end
+return 0
+"""
+
+
 class MusicBrainzCollector:
     """
     MusicBrainz Data Collection Service.
@@ -58,6 +79,12 @@ class MusicBrainzCollector:
         except Exception as e:
             self.logger.error(f"Failed to initialize MusicBrainz client: {e}")
             raise
+        
+        # Response cache: repeated development runs issue identical searches,
+        # and each one costs a 1 req/s rate-limit slot. Connection is lazy,
+        # and cache errors fall back to the live API.
+        self.redis = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        self._rate_slot = self.redis.register_script(_RATE_SLOT_LUA)
     
     async def test_connection(self) -> bool:
         """
@@ -83,6 +110,96 @@ class MusicBrainzCollector:
             self.logger.error(f"Connection test failed: {e}")
             return False
     
+    async def _acquire_rate_slot(self, max_wait: float = 5.0) -> None:
+        """
+        Claim a slot in the shared MusicBrainz rate-limit window.
+        
+        Coordinates all collector processes through a Redis sorted set so the
+        combined request rate stays at 1 req/s. Falls back silently to the
+        client's local limiter if Redis is unavailable or the wait exceeds
+        max_wait.
+        """
+        deadline = time.monotonic() + max_wait
+        try:
+            while time.monotonic() < deadline:
+                now = time.time()
+                allowed = await self._rate_slot(
+                    keys=["mb:ratelimit"],
+                    args=[now - 1, now, 1, uuid.uuid4().hex]
+                )
+                if allowed:
+                    return
+                await asyncio.sleep(0.05)
+        except Exception as e:
+            self.logger.debug(f"Distributed rate limiter unavailable: {e}")
+    
+    # Below this batch size the thread fan-out costs more than it saves
+    _PARALLEL_THRESHOLD = 64
+    
+    async def _process_batch(self, entities: List[Dict[str, Any]], query: str, label_key: str) -> List[Dict[str, Any]]:
+        """
+        Process a batch of entities, fanning out to threads for large ones.
+        
+        Small batches run inline through the generator; batches above
+        _PARALLEL_THRESHOLD are split across worker threads so correlation
+        prep overlaps with other event-loop work.
+        
+        Args:
+            entities: Raw entity dictionaries from the API response
+            query: Originating search query
+            label_key: Entity field used in log messages
+            
+        Returns:
+            List of correlation-ready records
+        """
+        if len(entities) <= self._PARALLEL_THRESHOLD:
+            return list(self._process_entities(entities, query, label_key))
+        
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(entities) // workers)
+        chunks = [entities[i:i + chunk_size] for i in range(0, len(entities), chunk_size)]
+        results = await asyncio.gather(*[
+            asyncio.to_thread(lambda c=chunk: list(self._process_entities(c, query, label_key)))
+            for chunk in chunks
+        ])
+        return [record for chunk_result in results for record in chunk_result]
+    
+    async def _cached_search(self, kind: str, query: str, limit: int, search) -> Dict[str, Any]:
+        """
+        Run a search through the Redis response cache.
+        
+        Args:
+            kind: Search type used in the cache key ("artist" or "release")
+            query: Search query
+            limit: Maximum number of results
+            search: Async client search method to call on a cache miss
+            
+        Returns:
+            Raw response data dictionary, or empty dict on failure
+        """
+        key = f"mb:search:{kind}:{hashlib.sha1(f'{query}|{limit}'.encode()).hexdigest()}"
+        
+        try:
+            cached = await self.redis.get(key)
+            if cached is not None:
+                self.logger.debug(f"Cache hit for {kind} search: {query}")
+                return orjson.loads(cached)
+        except Exception as e:
+            self.logger.debug(f"Redis cache unavailable, calling API directly: {e}")
+        
+        await self._acquire_rate_slot()
+        response = await search(query=query, limit=limit)
+        if not response.success:
+            self.logger.error(f"Failed to search {kind}s: {response.error}")
+            return {}
+        
+        try:
+            await self.redis.setex(key, 3600, orjson.dumps(response.data))
+        except Exception:
+            pass  # cache write failures never block collection
+        
+        return response.data
+    
     async def collect_artist_data(self, artist_query: str, limit: int = 5) -> Dict[str, Any]:
         """
         Collect artist data from MusicBrainz.
@@ -97,38 +214,22 @@ class MusicBrainzCollector:
         self.logger.info(f"Collecting artist data for query: {artist_query}")
         
         try:
-            # Search for artists
-            response = await self.client.search_artist(query=artist_query, limit=limit)
-            
-            if not response.success:
-                self.logger.error(f"Failed to search artists: {response.error}")
+            # Search for artists (Redis-cached)
+            artists_data = await self._cached_search("artist", artist_query, limit, self.client.search_artist)
+            if not artists_data:
                 return {}
-            
-            artists_data = response.data
             collected_data = {
                 "query": artist_query,
                 "total_results": artists_data.get("count", 0),
                 "artists": [],
-                "collection_timestamp": datetime.utcnow().isoformat() + "Z"
+                "collection_timestamp": datetime.utcnow().isoformat() + "Z",
+                "_kind": "artists"
             }
             
-            # Process each artist
-            for artist in artists_data.get("artists", []):
-                try:
-                    # Prepare correlation data
-                    correlation_data = self.client.prepare_correlation_data(artist)
-                    
-                    # Add additional metadata
-                    correlation_data["search_query"] = artist_query
-                    correlation_data["search_score"] = artist.get("score", 0)
-                    
-                    collected_data["artists"].append(correlation_data)
-                    
-                    self.logger.debug(f"Processed artist: {artist.get('name', 'Unknown')}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing artist {artist.get('name', 'Unknown')}: {e}")
-                    continue
+            # Process each artist; large batches fan out across threads
+            collected_data["artists"] = await self._process_batch(
+                artists_data.get("artists", []), artist_query, "name"
+            )
             
             self.logger.info(f"Successfully collected data for {len(collected_data['artists'])} artists")
             return collected_data
@@ -137,6 +238,81 @@ class MusicBrainzCollector:
             self.logger.error(f"Error collecting artist data: {e}")
             return {}
     
+    async def collect_artists_bulk(self, queries: List[str], limit: int = 5) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect artist data for several queries with a single API request.
+        
+        MusicBrainz enforces a 1 req/s rate limit, so N separate searches pay
+        N-1 seconds of waiting. Combining the queries into one Lucene OR
+        expression returns the same results in one request and one
+        rate-limit slot.
+        
+        Args:
+            queries: Artist search queries to combine
+            limit: Maximum number of results per query
+            
+        Returns:
+            Dictionary mapping each input query to its collected artist data
+        """
+        self.logger.info(f"Collecting artist data in bulk for {len(queries)} queries")
+        
+        try:
+            combined_query = " OR ".join(f'artist:"{q}"' for q in queries)
+            # Goes through the shared cache and the distributed rate limiter
+            # like every other search, so a bulk run can't slip an extra
+            # uncoordinated request past the 1 req/s API limit
+            artists_data = await self._cached_search(
+                "artist_bulk", combined_query, limit * len(queries), self.client.search_artist
+            )
+            if not artists_data:
+                return {}
+            timestamp = datetime.utcnow().isoformat() + "Z"
+            results = {
+                query: {
+                    "query": query,
+                    "total_results": 0,
+                    "artists": [],
+                    "collection_timestamp": timestamp,
+                    "_kind": "artists"
+                }
+                for query in queries
+            }
+            lowered = [(query, query.lower()) for query in queries]
+            
+            # Demultiplex the combined result set back to the input queries.
+            # The search is fuzzy, so hits rarely equal a query verbatim -
+            # assign each hit to its closest query by name similarity, then
+            # keep the top `limit` hits per query by MusicBrainz score.
+            buckets: Dict[str, List[Dict[str, Any]]] = {query: [] for query in queries}
+            for artist in artists_data.get("artists", []):
+                name = artist.get("name", "").lower()
+                if not name:
+                    continue
+                query = max(lowered, key=lambda pair: SequenceMatcher(None, name, pair[1]).ratio())[0]
+                buckets[query].append(artist)
+            
+            for query, hits in buckets.items():
+                hits.sort(key=lambda a: a.get("score", 0), reverse=True)
+                bucket = results[query]
+                for artist in hits[:limit]:
+                    try:
+                        correlation_data = self.client.prepare_correlation_data(artist)
+                        correlation_data["search_query"] = query
+                        correlation_data["search_score"] = artist.get("score", 0)
+                        bucket["artists"].append(correlation_data)
+                        bucket["total_results"] += 1
+                    except Exception as e:
+                        self.logger.error(f"Error processing artist {artist.get('name', 'Unknown')}: {e}")
+                        continue
+            
+            self.logger.info(f"Bulk collection complete: "
+                             f"{sum(len(r['artists']) for r in results.values())} artists")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error collecting bulk artist data: {e}")
+            return {}
+    
     async def collect_release_data(self, release_query: str, limit: int = 5) -> Dict[str, Any]:
         """
         Collect release (album) data from MusicBrainz.
@@ -151,38 +327,22 @@ class MusicBrainzCollector:
         self.logger.info(f"Collecting release data for query: {release_query}")
         
         try:
-            # Search for releases
-            response = await self.client.search_release(query=release_query, limit=limit)
-            
-            if not response.success:
-                self.logger.error(f"Failed to search releases: {response.error}")
+            # Search for releases (Redis-cached)
+            releases_data = await self._cached_search("release", release_query, limit, self.client.search_release)
+            if not releases_data:
                 return {}
-            
-            releases_data = response.data
             collected_data = {
                 "query": release_query,
                 "total_results": releases_data.get("count", 0),
                 "releases": [],
-                "collection_timestamp": datetime.utcnow().isoformat() + "Z"
+                "collection_timestamp": datetime.utcnow().isoformat() + "Z",
+                "_kind": "releases"
             }
             
-            # Process each release
-            for release in releases_data.get("releases", []):
-                try:
-                    # Prepare correlation data
-                    correlation_data = self.client.prepare_correlation_data(release)
-                    
-                    # Add additional metadata
-                    correlation_data["search_query"] = release_query
-                    correlation_data["search_score"] = release.get("score", 0)
-                    
-                    collected_data["releases"].append(correlation_data)
-                    
-                    self.logger.debug(f"Processed release: {release.get('title', 'Unknown')}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing release {release.get('title', 'Unknown')}: {e}")
-                    continue
+            # Process each release; large batches fan out across threads
+            collected_data["releases"] = await self._process_batch(
+                releases_data.get("releases", []), release_query, "title"
+            )
             
             self.logger.info(f"Successfully collected data for {len(collected_data['releases'])} releases")
             return collected_data
@@ -191,6 +351,56 @@ class MusicBrainzCollector:
             self.logger.error(f"Error collecting release data: {e}")
             return {}
     
+    def _process_entities(self, entities, query: str, label_key: str):
+        """
+        Yield correlation-ready records for a list of raw API entities.
+        
+        Processing lazily keeps peak memory at one record instead of
+        duplicating the raw response as a second full list; callers that
+        stream to disk never materialize the batch at all.
+        
+        Args:
+            entities: Raw artist/release dictionaries from the API response
+            query: Originating search query, attached to each record
+            label_key: Entity field used in log messages ("name" or "title")
+        """
+        for entity in entities:
+            try:
+                correlation_data = self.client.prepare_correlation_data(entity)
+                correlation_data["search_query"] = query
+                correlation_data["search_score"] = entity.get("score", 0)
+                
+                self.logger.debug(f"Processed entity: {entity.get(label_key, 'Unknown')}")
+                yield correlation_data
+                
+            except Exception as e:
+                self.logger.error(f"Error processing entity {entity.get(label_key, 'Unknown')}: {e}")
+                continue
+    
+    async def save_ndjson(self, items, filename: str) -> None:
+        """
+        Stream an iterable of records to an NDJSON file.
+        
+        Writes one orjson line per record, so peak memory stays O(1) for
+        arbitrarily large collections.
+        
+        Args:
+            items: Iterable of JSON-serializable records
+            filename: Output filename
+        """
+        try:
+            filepath = self.output_dir / filename
+            
+            def _write():
+                with open(filepath, 'wb') as f:
+                    f.writelines(orjson.dumps(item) + b"\n" for item in items)
+            
+            await asyncio.to_thread(_write)
+            self.logger.info(f"Data saved to {filepath}")
+            
+        except Exception as e:
+            self.logger.error(f"Error saving data to {filename}: {e}")
+    
     async def save_data(self, data: Dict[str, Any], filename: str) -> None:
         """
         Save collected data to a JSON file.
@@ -202,8 +412,11 @@ class MusicBrainzCollector:
         try:
             filepath = self.output_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize and write in a worker thread so multi-MB dumps don't
+            # stall the event loop (and any overlapped HTTP requests); orjson
+            # emits UTF-8 bytes directly, skipping the stdlib indent writer
+            payload = await asyncio.to_thread(orjson.dumps, data, option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(filepath.write_bytes, payload)
             
             self.logger.info(f"Data saved to {filepath}")
             
@@ -220,27 +433,27 @@ class MusicBrainzCollector:
         Returns:
             Dictionary containing collection statistics
         """
-        stats = {
-            "collection_timestamp": datetime.utcnow().isoformat() + "Z",
-            "total_datasets": len(datasets),
-            "datasets": [],
-            "total_items": 0,
-            "data_sources": ["musicbrainz"],
-            "collection_duration": None
-        }
-        
-        for dataset in datasets:
-            dataset_stats = {
+        # Each dataset is tagged with its item key at creation, so the stats
+        # pass reads it directly instead of probing "artists" then "releases"
+        # (which always built a fallback list even on the hit path)
+        dataset_stats = [
+            {
                 "query": dataset.get("query", "unknown"),
                 "total_results": dataset.get("total_results", 0),
-                "items_collected": len(dataset.get("artists", dataset.get("releases", []))),
+                "items_collected": len(dataset.get(dataset.get("_kind", ""), [])),
                 "timestamp": dataset.get("collection_timestamp")
             }
-            
-            stats["datasets"].append(dataset_stats)
-            stats["total_items"] += dataset_stats["items_collected"]
+            for dataset in datasets
+        ]
         
-        return stats
+        return {
+            "collection_timestamp": datetime.utcnow().isoformat() + "Z",
+            "total_datasets": len(datasets),
+            "datasets": dataset_stats,
+            "total_items": sum(d["items_collected"] for d in dataset_stats),
+            "data_sources": ["musicbrainz"],
+            "collection_duration": None
+        }
     
     async def run_collection(self) -> None:
         """
@@ -260,20 +473,44 @@ class MusicBrainzCollector:
                 self.logger.error("Connection test failed. Exiting.")
                 return
             
-            # Collect artist data
-            artist_data = await self.collect_artist_data("Coldplay", limit=3)
-            if artist_data:
-                await self.save_data(artist_data, "artist_data.json")
+            # Collect artist and release data concurrently - the two searches
+            # are independent, so wall-clock drops to the slower of the pair.
+            # The artist queries ride one bulk request (one rate-limit slot).
+            bulk_artists, release_data = await asyncio.gather(
+                self.collect_artists_bulk(["Coldplay", "Radiohead"], limit=3),
+                self.collect_release_data("Parachutes", limit=3),
+                return_exceptions=True
+            )
+            if isinstance(bulk_artists, Exception):
+                self.logger.error(f"Artist collection failed: {bulk_artists}")
+                bulk_artists = {}
             
-            # Collect release data
-            release_data = await self.collect_release_data("Parachutes", limit=3)
-            if release_data:
-                await self.save_data(release_data, "release_data.json")
+            # Flatten the per-query buckets into one artists dataset so the
+            # stats and save paths keep their single-dataset shape
+            artist_data = {}
+            if bulk_artists:
+                artist_data = {
+                    "query": " OR ".join(bulk_artists),
+                    "total_results": sum(bucket["total_results"] for bucket in bulk_artists.values()),
+                    "artists": [artist for bucket in bulk_artists.values() for artist in bucket["artists"]],
+                    "collection_timestamp": next(iter(bulk_artists.values()))["collection_timestamp"],
+                    "_kind": "artists"
+                }
+            if isinstance(release_data, Exception):
+                self.logger.error(f"Release collection failed: {release_data}")
+                release_data = {}
             
-            # Generate and save collection statistics
+            # Generate collection statistics
             stats = await self.generate_collection_stats(artist_data, release_data)
             stats["collection_duration"] = (datetime.utcnow() - start_time).total_seconds()
-            await self.save_data(stats, "collection_stats.json")
+            
+            # The three saves hit independent files, so overlap them too
+            saves = [self.save_data(stats, "collection_stats.json")]
+            if artist_data:
+                saves.append(self.save_data(artist_data, "artist_data.json"))
+            if release_data:
+                saves.append(self.save_data(release_data, "release_data.json"))
+            await asyncio.gather(*saves)
             
             self.logger.info("MusicBrainz data collection completed successfully")
             
@@ -0,0 +1 @@
+"""Spotify data collection service package"""
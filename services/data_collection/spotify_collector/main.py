@@ -15,15 +15,13 @@ Based on the existing pokemon_collector pattern and project documentation.
 """
 
 import asyncio
-import json
-import sys
+import time
+
+import orjson
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-# Add the packages to the path for proper imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages" / "shared_core"))
-
 from shared_core.config.spotify_config import SpotifyConfig
 from shared_core.api.clients.spotify.spotify_client import SpotifyClient
 from shared_core.utils.centralized_logging import CentralizedLogger
@@ -32,6 +30,72 @@ from shared_core.utils.centralized_logging import CentralizedLogger
 logger = CentralizedLogger.get_logger("spotify_collector")
 
 
+class _AudioFeatureBatcher:
+    """
+    Coalesce audio-feature lookups from concurrent callers into shared batches
+
+    Callers hand over track IDs and await a per-ID future; the batcher flushes
+    once a full Spotify-sized batch (100 IDs) accumulates or after a short
+    queue window, so overlapping collection methods share API calls instead of
+    each issuing their own.
+    """
+
+    def __init__(self, client: SpotifyClient, max_batch_size: int = 100, max_queue_time: float = 0.05):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._sem = asyncio.Semaphore(4)  # rate-limit courtesy for concurrent flushes
+
+    async def get(self, track_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Resolve audio features for track_ids, one entry per ID (None on miss)"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for track_id in track_ids:
+            future = self._pending.get(track_id)
+            if future is None:
+                future = loop.create_future()
+                self._pending[track_id] = future
+                if len(self._pending) >= self.max_batch_size:
+                    await self._flush()
+                elif self._flush_task is None:
+                    self._flush_task = loop.create_task(self._flush_later())
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.max_queue_time)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        batch = self._pending
+        self._pending = {}
+        if not batch:
+            return
+
+        batch_ids = list(batch)
+        features: List[Optional[Dict[str, Any]]] = [None] * len(batch_ids)
+        try:
+            async with self._sem:
+                response = await self.client.get_multiple_tracks_audio_features(batch_ids)
+            if response.success:
+                returned = response.data.get('audio_features', [])
+                features[:len(returned)] = returned
+            else:
+                logger.error(f"❌ Audio features batch failed: {response.errors}")
+        except Exception as e:
+            logger.error(f"❌ Audio features batch failed: {e}")
+
+        for track_id, audio_features in zip(batch_ids, features):
+            batch[track_id].set_result(audio_features)
+
+
 class SpotifyCollectorService:
     """
     Spotify data collection service for correlation analysis
@@ -43,11 +107,21 @@ class SpotifyCollectorService:
     - Correlation-ready data extraction
     """
     
-    def __init__(self):
-        """Initialize the Spotify collector service"""
+    def __init__(self, config: Optional[SpotifyConfig] = None):
+        """
+        Initialize the Spotify collector service
+        
+        Args:
+            config: Spotify configuration; defaults to the shared singleton
+        """
         self.logger = logger
-        self.config = SpotifyConfig.get_instance()
+        self.config = config if config is not None else SpotifyConfig.get_instance()
         self.client: Optional[SpotifyClient] = None
+        self._feature_batcher: Optional[_AudioFeatureBatcher] = None
+        # Static after init, so compute once and reuse in every stats call
+        self._config_summary = self.config.get_config_summary()
+        self._metrics_summary: Dict[str, Any] = {}
+        self._metrics_requests_seen = -1
         self.collection_stats = {
             "tracks_collected": 0,
             "artists_collected": 0,
@@ -77,7 +151,8 @@ class SpotifyCollectorService:
                 redirect_uri=self.config.redirect_uri(),
                 debug_mode=True
             )
-            
+            self._feature_batcher = _AudioFeatureBatcher(self.client)
+
             # Check if we have stored tokens
             stored_access_token = self.config.access_token()
             stored_refresh_token = self.config.refresh_token()
@@ -85,7 +160,16 @@ class SpotifyCollectorService:
             if stored_access_token:
                 self.client.access_token = stored_access_token
                 self.client.refresh_token = stored_refresh_token
-                self.logger.info("✅ Using stored access token")
+
+                # Proactively refresh if the stored token is expired (or about
+                # to be) so the first API call doesn't burn a 401 round-trip
+                expires_at = self.config.token_expires_at()
+                if (expires_at is not None and stored_refresh_token
+                        and time.time() + 30 >= expires_at):
+                    self.logger.info("🔄 Stored access token near expiry - refreshing eagerly")
+                    await self.client.refresh_access_token()
+                else:
+                    self.logger.info("✅ Using stored access token")
             else:
                 self.logger.warning("⚠️  No stored access token found - OAuth flow required")
                 self.logger.info("📝 Use the get_authorization_url() method to start OAuth flow")
@@ -96,6 +180,13 @@ class SpotifyCollectorService:
             self.logger.error(f"Failed to initialize Spotify client: {e}")
             return False
     
+    async def __aenter__(self) -> "SpotifyCollectorService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self.client:
+            await self.client.close()
+    
     def get_authorization_url(self) -> str:
         """
         Get the OAuth authorization URL for manual authentication
@@ -197,41 +288,48 @@ class SpotifyCollectorService:
             tracks = tracks_response.data.get('items', [])
             self.logger.info(f"📥 Retrieved {len(tracks)} tracks")
             
+            # One timestamp per collection run - every record in this batch
+            # shares it, instead of a strftime-equivalent call per track
+            collection_timestamp = datetime.now().isoformat()
+            
             # Extract track IDs for audio features
             track_ids = [track['id'] for track in tracks]
             
-            # Get audio features in batches
-            enhanced_tracks = []
-            batch_size = 100  # Spotify API limit
-            
-            for i in range(0, len(track_ids), batch_size):
-                batch_ids = track_ids[i:i+batch_size]
-                
-                self.logger.info(f"📊 Fetching audio features for batch {i//batch_size + 1}")
-                
-                features_response = await self.client.get_multiple_tracks_audio_features(batch_ids)
-                
-                if features_response.success:
-                    audio_features = features_response.data.get('audio_features', [])
-                    
-                    # Combine track data with audio features
-                    for j, track in enumerate(tracks[i:i+batch_size]):
-                        if j < len(audio_features) and audio_features[j]:
-                            enhanced_track = {
-                                **track,
-                                'audio_features': audio_features[j],
-                                'correlation_features': self.client.extract_audio_features_for_correlation(audio_features[j]),
-                                'isrc': self.client.extract_isrc_for_cross_linking(track),
-                                'collection_timestamp': datetime.now().isoformat()
-                            }
-                            enhanced_tracks.append(enhanced_track)
-                            self.collection_stats['tracks_collected'] += 1
-                            self.collection_stats['audio_features_collected'] += 1
-                        else:
-                            self.logger.warning(f"⚠️  No audio features for track: {track.get('name', 'Unknown')}")
-                
-                # Rate limiting courtesy
-                await asyncio.sleep(0.1)
+            # Get audio features through the shared batcher so concurrent
+            # collection methods coalesce their IDs into common batches
+            audio_features = await self._feature_batcher.get(track_ids)
+            correlation_features = self.client.extract_audio_features_for_correlation_batch(audio_features)
+
+            # Combine track data with audio features; the result list is
+            # pre-sized and trimmed rather than grown append-by-append, and
+            # stats are bumped once after the loop instead of per track
+            enhanced_tracks = [None] * len(tracks)
+            collected = 0
+            missing_features = []
+            # Bind the hot helper once - skips two attribute lookups per track
+            _extract_isrc = self.client.extract_isrc_for_cross_linking
+            for track, track_features, track_correlation in zip(tracks, audio_features, correlation_features):
+                if track_features:
+                    # The parsed response dicts are ours alone - annotate them
+                    # in place rather than re-spreading every track
+                    track['audio_features'] = track_features
+                    track['correlation_features'] = track_correlation
+                    track['isrc'] = _extract_isrc(track)
+                    track['collection_timestamp'] = collection_timestamp
+                    enhanced_tracks[collected] = track
+                    collected += 1
+                else:
+                    missing_features.append(track.get('name', 'Unknown'))
+            del enhanced_tracks[collected:]
+            self.collection_stats['tracks_collected'] += collected
+            self.collection_stats['audio_features_collected'] += collected
+            
+            if missing_features:
+                # One aggregated warning instead of a log line per miss
+                self.logger.warning(
+                    "⚠️  No audio features for %d tracks: %s",
+                    len(missing_features), missing_features[:5]
+                )
             
             self.logger.info(f"✅ Successfully collected {len(enhanced_tracks)} tracks with audio features")
             return enhanced_tracks
@@ -267,21 +365,20 @@ class SpotifyCollectorService:
             items = response.data.get('items', [])
             self.logger.info(f"📥 Retrieved {len(items)} recently played tracks")
             
+            collection_timestamp = datetime.now().isoformat()
+            
             # Extract tracks and add temporal context
             recent_tracks = []
+            _extract_isrc = self.client.extract_isrc_for_cross_linking
             for item in items:
                 track = item.get('track', {})
-                played_at = item.get('played_at')
                 
-                enhanced_track = {
-                    **track,
-                    'played_at': played_at,
-                    'context': item.get('context', {}),
-                    'isrc': self.client.extract_isrc_for_cross_linking(track),
-                    'collection_timestamp': datetime.now().isoformat()
-                }
-                recent_tracks.append(enhanced_track)
-                self.collection_stats['tracks_collected'] += 1
+                track['played_at'] = item.get('played_at')
+                track['context'] = item.get('context', {})
+                track['isrc'] = _extract_isrc(track)
+                track['collection_timestamp'] = collection_timestamp
+                recent_tracks.append(track)
+            self.collection_stats['tracks_collected'] += len(recent_tracks)
             
             self.logger.info(f"✅ Successfully collected {len(recent_tracks)} recently played tracks")
             return recent_tracks
@@ -319,29 +416,27 @@ class SpotifyCollectorService:
             tracks = search_response.data.get('tracks', {}).get('items', [])
             self.logger.info(f"📥 Found {len(tracks)} tracks")
             
+            collection_timestamp = datetime.now().isoformat()
+            
             # Get audio features for search results
             track_ids = [track['id'] for track in tracks]
             enhanced_tracks = []
             
             if track_ids:
-                features_response = await self.client.get_multiple_tracks_audio_features(track_ids)
-                
-                if features_response.success:
-                    audio_features = features_response.data.get('audio_features', [])
-                    
-                    for i, track in enumerate(tracks):
-                        if i < len(audio_features) and audio_features[i]:
-                            enhanced_track = {
-                                **track,
-                                'audio_features': audio_features[i],
-                                'correlation_features': self.client.extract_audio_features_for_correlation(audio_features[i]),
-                                'isrc': self.client.extract_isrc_for_cross_linking(track),
-                                'search_query': query,
-                                'collection_timestamp': datetime.now().isoformat()
-                            }
-                            enhanced_tracks.append(enhanced_track)
-                            self.collection_stats['tracks_collected'] += 1
-                            self.collection_stats['audio_features_collected'] += 1
+                audio_features = await self._feature_batcher.get(track_ids)
+                correlation_features = self.client.extract_audio_features_for_correlation_batch(audio_features)
+
+                _extract_isrc = self.client.extract_isrc_for_cross_linking
+                for track, track_features, track_correlation in zip(tracks, audio_features, correlation_features):
+                    if track_features:
+                        track['audio_features'] = track_features
+                        track['correlation_features'] = track_correlation
+                        track['isrc'] = _extract_isrc(track)
+                        track['search_query'] = query
+                        track['collection_timestamp'] = collection_timestamp
+                        enhanced_tracks.append(track)
+                self.collection_stats['tracks_collected'] += len(enhanced_tracks)
+                self.collection_stats['audio_features_collected'] += len(enhanced_tracks)
             
             self.logger.info(f"✅ Successfully analyzed {len(enhanced_tracks)} search results")
             return enhanced_tracks
@@ -351,14 +446,45 @@ class SpotifyCollectorService:
             self.collection_stats['errors'] += 1
             return []
     
-    def save_data_to_json(self, data: List[Dict[str, Any]], filename: str) -> bool:
+    def _write_json(self, data: List[Dict[str, Any]], filename: str) -> bool:
+        """Synchronous JSON write helper (runs in a worker thread)"""
+        try:
+            output_path = Path(__file__).parent / "output" / filename
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            
+            self.logger.info(f"💾 Saved {len(data)} records to {output_path}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error saving data: {e}")
+            return False
+    
+    async def save_data_to_json(self, data: List[Dict[str, Any]], filename: str) -> bool:
         """
-        Save collected data to JSON file
+        Save collected data to JSON file without blocking the event loop
         
         Args:
             data: Data to save
             filename: Output filename
             
+        Returns:
+            bool: True if successful
+        """
+        return await asyncio.to_thread(self._write_json, data, filename)
+    
+    def append_stats_record(self, stats: Dict[str, Any], filename: str = "collection_stats.ndjson") -> bool:
+        """
+        Append one stats record to an NDJSON log
+        
+        Run summaries accumulate one line per run instead of rewriting the
+        whole stats file each time.
+        
+        Args:
+            stats: Stats record to append
+            filename: Output filename
+            
         Returns:
             bool: True if successful
         """
@@ -366,22 +492,28 @@ class SpotifyCollectorService:
             output_path = Path(__file__).parent / "output" / filename
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'ab') as f:
+                f.write(orjson.dumps(stats) + b"\n")
             
-            self.logger.info(f"💾 Saved {len(data)} records to {output_path}")
+            self.logger.info(f"💾 Appended stats record to {output_path}")
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Error saving data: {e}")
+            self.logger.error(f"❌ Error saving stats: {e}")
             return False
     
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get collection statistics"""
+        if self.client:
+            # Only rebuild the metrics summary when new requests have landed
+            request_count = len(self.client.request_history)
+            if request_count != self._metrics_requests_seen:
+                self._metrics_summary = self.client.get_metrics_summary()
+                self._metrics_requests_seen = request_count
         return {
             **self.collection_stats,
-            "client_metrics": self.client.get_metrics_summary() if self.client else {},
-            "config_summary": self.config.get_config_summary()
+            "client_metrics": self._metrics_summary,
+            "config_summary": self._config_summary
         }
     
     async def run_proof_of_concept(self) -> bool:
@@ -408,28 +540,46 @@ class SpotifyCollectorService:
                 self.logger.error("❌ API connection failed - check your tokens")
                 return False
             
-            # Step 3: Collect user's top tracks
-            self.logger.info("3️⃣ Collecting user's top tracks...")
-            top_tracks = await self.collect_user_top_tracks(limit=20)
-            if top_tracks:
-                self.save_data_to_json(top_tracks, "top_tracks.json")
-            
-            # Step 4: Collect recently played tracks
-            self.logger.info("4️⃣ Collecting recently played tracks...")
-            recent_tracks = await self.collect_recently_played(limit=20)
-            if recent_tracks:
-                self.save_data_to_json(recent_tracks, "recent_tracks.json")
+            # Steps 3-5: the three collections are independent, so overlap
+            # their HTTP latency instead of serializing three round trips
+            self.logger.info("3️⃣4️⃣5️⃣ Collecting top tracks, recently played, and search results...")
+            top_tracks, recent_tracks, search_results = await asyncio.gather(
+                self.collect_user_top_tracks(limit=20),
+                self.collect_recently_played(limit=20),
+                self.search_and_analyze("electronic dance music", limit=10),
+                return_exceptions=True
+            )
             
-            # Step 5: Search and analyze
-            self.logger.info("5️⃣ Searching and analyzing tracks...")
-            search_results = await self.search_and_analyze("electronic dance music", limit=10)
-            if search_results:
-                self.save_data_to_json(search_results, "search_results.json")
+            if isinstance(top_tracks, Exception):
+                self.logger.error(f"❌ Top tracks collection failed: {top_tracks}")
+                self.collection_stats['errors'] += 1
+                top_tracks = []
+            if isinstance(recent_tracks, Exception):
+                self.logger.error(f"❌ Recently played collection failed: {recent_tracks}")
+                self.collection_stats['errors'] += 1
+                recent_tracks = []
+            if isinstance(search_results, Exception):
+                self.logger.error(f"❌ Search and analyze failed: {search_results}")
+                self.collection_stats['errors'] += 1
+                search_results = []
+            
+            # The three writes run in worker threads, so overlap them too
+            saves = [
+                self.save_data_to_json(data, filename)
+                for data, filename in (
+                    (top_tracks, "top_tracks.json"),
+                    (recent_tracks, "recent_tracks.json"),
+                    (search_results, "search_results.json"),
+                )
+                if data
+            ]
+            if saves:
+                await asyncio.gather(*saves)
             
             # Step 6: Generate summary
             self.logger.info("6️⃣ Generating collection summary...")
             stats = self.get_collection_stats()
-            self.save_data_to_json([stats], "collection_stats.json")
+            self.append_stats_record(stats)
             
             self.logger.info("=" * 60)
             self.logger.info("✅ Proof of Concept completed successfully!")
@@ -449,44 +599,49 @@ class SpotifyCollectorService:
 async def main():
     """Main entry point for the proof of concept"""
     
-    # Initialize the service
-    service = SpotifyCollectorService()
-    
-    # Check if we need to start OAuth flow
-    try:
-        config = SpotifyConfig.get_instance()
-        if not config.access_token():
-            print("🔑 OAuth setup required:")
-            print("1. Set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET in your environment")
-            print("2. Run the service to get authorization URL")
-            print("3. Complete OAuth flow and set SPOTIFY_ACCESS_TOKEN")
-            print("\nExample .env file:")
-            print("SPOTIFY_CLIENT_ID=your_client_id_here")
-            print("SPOTIFY_CLIENT_SECRET=your_client_secret_here")
-            print("SPOTIFY_REDIRECT_URI=http://localhost:8080/callback")
-            print("# After OAuth:")
-            print("SPOTIFY_ACCESS_TOKEN=your_access_token_here")
-            print("SPOTIFY_REFRESH_TOKEN=your_refresh_token_here")
-            
-            # Initialize client to show auth URL
-            if await service.initialize_client():
-                service.get_authorization_url()
-            
-            return
+    # Initialize the service with the shared config; the context manager
+    # closes the client's keep-alive connection pool on the way out
+    config = SpotifyConfig.get_instance()
+    async with SpotifyCollectorService(config=config) as service:
+        # Check if we need to start OAuth flow
+        try:
+            if not config.access_token():
+                print("🔑 OAuth setup required:")
+                print("1. Set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET in your environment")
+                print("2. Run the service to get authorization URL")
+                print("3. Complete OAuth flow and set SPOTIFY_ACCESS_TOKEN")
+                print("\nExample .env file:")
+                print("SPOTIFY_CLIENT_ID=your_client_id_here")
+                print("SPOTIFY_CLIENT_SECRET=your_client_secret_here")
+                print("SPOTIFY_REDIRECT_URI=http://localhost:8080/callback")
+                print("# After OAuth:")
+                print("SPOTIFY_ACCESS_TOKEN=your_access_token_here")
+                print("SPOTIFY_REFRESH_TOKEN=your_refresh_token_here")
+            
+                # Initialize client to show auth URL
+                if await service.initialize_client():
+                    service.get_authorization_url()
+            
+                return
         
-        # Run the proof of concept
-        success = await service.run_proof_of_concept()
+            # Run the proof of concept
+            success = await service.run_proof_of_concept()
         
-        if success:
-            print("\n🎉 Spotify client proof of concept completed successfully!")
-            print("📁 Check the output/ directory for collected data files")
-        else:
-            print("\n❌ Proof of concept failed - check the logs for details")
+            if success:
+                print("\n🎉 Spotify client proof of concept completed successfully!")
+                print("📁 Check the output/ directory for collected data files")
+            else:
+                print("\n❌ Proof of concept failed - check the logs for details")
             
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return
 
 
-if __name__ == "__main__":
+def main_sync() -> None:
+    """Synchronous wrapper used as the packaged console-script entry point"""
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    main_sync()